@@ -1,31 +1,125 @@
 from flask import Flask, request, jsonify, render_template, redirect, session
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from bisect import bisect_left, insort
+from collections import deque
 from datetime import datetime, timedelta
+import gzip
+import heapq
+import itertools
 import json
+import math
 import os
+import re
+import threading
+
+# Optional fast JSON backend (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional brotli compression (pip install brotli)
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # File to store events persistently
 EVENTS_FILE = 'events_data.json'
 
+# Responses smaller than this (in bytes) are sent uncompressed
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_MIMETYPES = {'application/json', 'text/html', 'text/csv'}
+
+# Number of engagement changes remembered per event for delta sync
+ENGAGEMENT_CHANGE_LOG_SIZE = 500
+
+# Feedback ratings are on a 1-5 scale, sketched in steps of 0.1
+FEEDBACK_RATING_MIN = 1
+FEEDBACK_RATING_MAX = 5
+FEEDBACK_SKETCH_BINS = (FEEDBACK_RATING_MAX - FEEDBACK_RATING_MIN) * 10 + 1
+FEEDBACK_RECENT_COMMENTS = 10
+FEEDBACK_CATEGORIES = ('Overall Satisfaction', 'Content Quality', 'Organization', 'Venue Quality')
+FEEDBACK_TEXT_LIMITS = {'comment': 1000, 'attendee': 100, 'session': 100}
+
+# Automatic event lifecycle timing
+EVENT_DEFAULT_DURATION = timedelta(hours=4)
+EVENT_PREWARM_LEAD = timedelta(minutes=10)
+EVENT_ARCHIVE_DELAY = timedelta(hours=1)
+
+# Event search: field weights for ranking and result limits
+SEARCH_FIELD_WEIGHTS = {'title': 3, 'location': 2, 'description': 1}
+SEARCH_MAX_SUGGESTIONS = 10
+SEARCH_MAX_PER_PAGE = 100
+
 # Global variables for data storage
 events = []
+events_by_id = {}     # Event id -> event, kept in step with events
 engagement_data = {}  # Store engagement data per event
+engagement_change_log = {}  # Recent engagement changes per event (in memory only)
 tickets_data = {}     # Store ticket sales per event
+event_feedback = {}   # Store feedback aggregates per event
+feedback_totals = {}  # Feedback aggregate across all events
+
+# Guards events, engagement state and the search index, which request
+# handlers and the lifecycle worker thread both change
+data_lock = threading.RLock()
+
+# JSON serialization helpers (orjson when available, stdlib json otherwise)
+def dumps_json(obj):
+    """Serialize obj to compact UTF-8 JSON bytes"""
+    # Same rules as Flask's default provider: dates, UUIDs, dataclasses and
+    # Decimals are converted, anything else raises TypeError
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=DefaultJSONProvider.default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Fall back to stdlib for values orjson can't encode, e.g. big ints
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False,
+                      default=DefaultJSONProvider.default).encode('utf-8')
+
+def loads_json(data):
+    """Deserialize JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def read_json_file(path):
+    """Read a JSON document from disk"""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+def write_json_file(path, obj):
+    """Write obj to disk as compact JSON"""
+    with open(path, 'wb') as f:
+        f.write(dumps_json(obj))
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by dumps_json/loads_json"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps_json(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return loads_json(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_json(obj), mimetype=self.mimetype)
 
 # Load events from file
 def load_events():
     if os.path.exists(EVENTS_FILE):
         try:
-            with open(EVENTS_FILE, 'r') as f:
-                return json.load(f)
+            return read_json_file(EVENTS_FILE)
         except:
             return []
     return []
 
 # Save events to file
 def save_events(events_data):
-    with open(EVENTS_FILE, 'w') as f:
-        json.dump(events_data, f, indent=2)
+    write_json_file(EVENTS_FILE, events_data)
 
 # In-memory storage for ticket bookings (in production, use a database)
 ticket_bookings = []
@@ -37,8 +131,59 @@ live_sales_data = {
 
 app = Flask(__name__, template_folder='../templates', static_folder='../static')
 app.secret_key = 'your-secret-key-here'  # Change this in production
+app.json = FastJSONProvider(app)
 CORS(app)
 
+def choose_encoding(accept_encoding):
+    """Pick the best supported content encoding from an Accept-Encoding header"""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+
+    # Highest q wins; on a tie prefer brotli for its better ratio
+    supported = ['br', 'gzip'] if brotli is not None else ['gzip']
+    best, best_q = None, 0
+    for encoding in supported:
+        q = accepted.get(encoding, accepted.get('*', 0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+@app.after_request
+def compress_response(response):
+    """Compress large responses when the client supports it"""
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code >= 300
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSION_MIMETYPES):
+        return response
+
+    encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+    response.vary.add('Accept-Encoding')
+    if encoding is None:
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESSION_MIN_SIZE:
+        return response
+
+    if encoding == 'br':
+        data = brotli.compress(data, quality=5)
+    else:
+        data = gzip.compress(data, compresslevel=6)
+
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
 # Load events data
 events = load_events()
 
@@ -78,6 +223,129 @@ if not events:
     ]
     save_events(events)
 
+events_by_id.update((event['id'], event) for event in events)
+
+# Event search index: an inverted index from tokens to weighted term
+# frequencies per event, plus a sorted vocabulary for prefix lookups and a
+# status index for filtering. Updated per event, never rebuilt on search.
+search_postings = {}      # token -> {event_id: weighted term frequency}
+search_vocabulary = []    # sorted tokens
+search_doc_tokens = {}    # event_id -> set of indexed tokens
+search_status_index = {}  # status -> set of event ids
+search_events = {}        # event_id -> event
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text).lower()) if text is not None else []
+
+def remove_event_from_index(event_id):
+    """Drop an event from the search index"""
+    with data_lock:
+        for token in search_doc_tokens.pop(event_id, ()):
+            postings = search_postings[token]
+            postings.pop(event_id, None)
+            if not postings:
+                del search_postings[token]
+                del search_vocabulary[bisect_left(search_vocabulary, token)]
+        for ids in search_status_index.values():
+            ids.discard(event_id)
+        search_events.pop(event_id, None)
+
+def index_event(event):
+    """Add or re-index an event in the search index"""
+    event_id = event['id']
+    weights = {}
+    for field, weight in SEARCH_FIELD_WEIGHTS.items():
+        for token in tokenize(event.get(field)):
+            weights[token] = weights.get(token, 0) + weight
+
+    with data_lock:
+        remove_event_from_index(event_id)
+        for token, weight in weights.items():
+            if token not in search_postings:
+                search_postings[token] = {}
+                insort(search_vocabulary, token)
+            search_postings[token][event_id] = weight
+
+        search_doc_tokens[event_id] = set(weights)
+        search_status_index.setdefault(event.get('status', 'upcoming'), set()).add(event_id)
+        search_events[event_id] = event
+
+def rebuild_search_index():
+    """Index every event from scratch"""
+    with data_lock:
+        for index in (search_postings, search_doc_tokens, search_status_index, search_events):
+            index.clear()
+        del search_vocabulary[:]
+        for event in events:
+            index_event(event)
+
+def complete_token(prefix, limit=None):
+    """Indexed tokens starting with prefix, in sorted order (all if no limit)"""
+    matches = []
+    with data_lock:
+        position = bisect_left(search_vocabulary, prefix)
+        while position < len(search_vocabulary) and (limit is None or len(matches) < limit):
+            token = search_vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            matches.append(token)
+            position += 1
+    return matches
+
+def search_index(query, status=None, currency=None, date_from=None, date_to=None):
+    """Return (event, score) pairs matching every query term, best first.
+
+    The last term is treated as a prefix unless the query ends with a
+    space, so partially typed words still match.
+    """
+    tokens = tokenize(query)
+    prefix = tokens.pop() if tokens and not query[-1:].isspace() else None
+
+    with data_lock:
+        candidates = None
+        if status:
+            candidates = set(search_status_index.get(status, ()))
+
+        total_events = len(search_events) or 1
+        scores = {}
+        term_groups = [[token] for token in tokens]
+        if prefix:
+            term_groups.append(complete_token(prefix))
+
+        for group in term_groups:
+            # An event matches a group if it contains any of the group's tokens
+            group_scores = {}
+            for token in group:
+                postings = search_postings.get(token, {})
+                idf = math.log(1 + total_events / len(postings)) if postings else 0
+                for event_id, weight in postings.items():
+                    group_scores[event_id] = max(group_scores.get(event_id, 0), weight * idf)
+            matched = set(group_scores)
+            candidates = matched if candidates is None else candidates & matched
+            for event_id in candidates:
+                scores[event_id] = scores.get(event_id, 0) + group_scores[event_id]
+
+        if candidates is None:
+            candidates = set(search_events)
+
+        results = []
+        for event_id in candidates:
+            event = search_events[event_id]
+            if currency and event.get('currency') != currency:
+                continue
+            if date_from and (event.get('date') or '') < date_from:
+                continue
+            if date_to and (event.get('date') or '') > date_to:
+                continue
+            results.append((event, scores.get(event_id, 0)))
+
+    results.sort(key=lambda result: (-result[1], result[0].get('date') or '', result[0]['id']))
+    return results
+
+rebuild_search_index()
+
 @app.route('/', methods=['GET'])
 def home():
     """Serve the home page with login"""
@@ -227,8 +495,13 @@ def create_event_api():
             'created_at': datetime.now().isoformat()
         }
         
-        events.append(new_event)
-        save_events(events)
+        with data_lock:
+            # Index first so a failure can't leave a saved but unindexed event
+            index_event(new_event)
+            events.append(new_event)
+            events_by_id[new_id] = new_event
+            save_events(events)
+            schedule_event_transitions(new_event)
         
         return jsonify({'success': True, 'event_id': new_id})
         
@@ -329,13 +602,244 @@ feedback_data = {
     ]
 }
 
+# Feedback aggregates are updated per response so stats never rescan
+# individual submissions. Every part is mergeable across events.
+def new_running_stats():
+    return {'count': 0, 'mean': 0.0, 'm2': 0.0}
+
+def update_running_stats(stats, value):
+    """Add a value using Welford's algorithm"""
+    stats['count'] += 1
+    delta = value - stats['mean']
+    stats['mean'] += delta / stats['count']
+    stats['m2'] += delta * (value - stats['mean'])
+
+def merge_running_stats(a, b):
+    """Combine two running stats (Chan et al. parallel variance)"""
+    count = a['count'] + b['count']
+    if count == 0:
+        return new_running_stats()
+    delta = b['mean'] - a['mean']
+    return {
+        'count': count,
+        'mean': a['mean'] + delta * b['count'] / count,
+        'm2': a['m2'] + b['m2'] + delta * delta * a['count'] * b['count'] / count
+    }
+
+def running_variance(stats):
+    return stats['m2'] / stats['count'] if stats['count'] > 1 else 0.0
+
+def add_to_sketch(sketch, rating):
+    """Count a rating in its 0.1-wide bin"""
+    sketch[int(round((rating - FEEDBACK_RATING_MIN) * 10))] += 1
+
+def sketch_quantile(sketch, q):
+    """Approximate quantile (to within 0.1) of the sketched ratings"""
+    total = sum(sketch)
+    if total == 0:
+        return None
+    rank = max(1, q * total)
+    seen = 0
+    for index, count in enumerate(sketch):
+        seen += count
+        if seen >= rank:
+            return round(FEEDBACK_RATING_MIN + index / 10, 1)
+    return FEEDBACK_RATING_MAX
+
+def new_feedback_aggregate():
+    return {
+        'total_responses': 0,
+        'overall': new_running_stats(),
+        'sketch': [0] * FEEDBACK_SKETCH_BINS,
+        'categories': {},
+        'nps': {'promoters': 0, 'passives': 0, 'detractors': 0},
+        'sentiment': {'positive': 0, 'neutral': 0, 'negative': 0},
+        'comments': []
+    }
+
+def merge_feedback_aggregates(a, b):
+    """Combine two feedback aggregates into a new one"""
+    merged = new_feedback_aggregate()
+    merged['total_responses'] = a['total_responses'] + b['total_responses']
+    merged['overall'] = merge_running_stats(a['overall'], b['overall'])
+    merged['sketch'] = [x + y for x, y in zip(a['sketch'], b['sketch'])]
+    for category in set(a['categories']) | set(b['categories']):
+        merged['categories'][category] = merge_running_stats(
+            a['categories'].get(category, new_running_stats()),
+            b['categories'].get(category, new_running_stats()))
+    for key in ('nps', 'sentiment'):
+        merged[key] = {bucket: a[key][bucket] + b[key][bucket] for bucket in a[key]}
+    merged['comments'] = sorted(a['comments'] + b['comments'],
+                                key=lambda comment: comment['timestamp'],
+                                reverse=True)[:FEEDBACK_RECENT_COMMENTS]
+    return merged
+
+def add_feedback_response(aggregate, response):
+    """Fold one validated feedback response into an aggregate"""
+    aggregate['total_responses'] += 1
+    rating = response['rating']
+    update_running_stats(aggregate['overall'], rating)
+    add_to_sketch(aggregate['sketch'], rating)
+
+    for category, value in response['ratings'].items():
+        if category not in aggregate['categories']:
+            aggregate['categories'][category] = new_running_stats()
+        update_running_stats(aggregate['categories'][category], value)
+
+    recommend = response.get('recommend')
+    if recommend is not None:
+        if recommend >= 9:
+            aggregate['nps']['promoters'] += 1
+        elif recommend >= 7:
+            aggregate['nps']['passives'] += 1
+        else:
+            aggregate['nps']['detractors'] += 1
+
+    aggregate['sentiment'][response['sentiment']] += 1
+
+    if response.get('comment'):
+        aggregate['comments'].insert(0, {
+            'rating': int(round(rating)),
+            'comment': response['comment'],
+            'attendee': response.get('attendee') or 'Anonymous',
+            'session': response.get('session') or 'General',
+            'timestamp': response['timestamp']
+        })
+        del aggregate['comments'][FEEDBACK_RECENT_COMMENTS:]
+
+def parse_feedback_response(data):
+    """Validate a feedback submission, raising ValueError if it is invalid"""
+    def rating_value(value, name):
+        if isinstance(value, bool):
+            raise ValueError(f'{name} must be a number')
+        value = float(value)
+        if not FEEDBACK_RATING_MIN <= value <= FEEDBACK_RATING_MAX:
+            raise ValueError(f'{name} must be between {FEEDBACK_RATING_MIN} and {FEEDBACK_RATING_MAX}')
+        return value
+
+    if data.get('rating') is None:
+        raise ValueError('rating is required')
+    rating = rating_value(data['rating'], 'rating')
+    ratings = {}
+    for category, value in (data.get('ratings') or {}).items():
+        if category not in FEEDBACK_CATEGORIES:
+            raise ValueError(f'Unknown rating category: {category}')
+        ratings[category] = rating_value(value, category)
+
+    recommend = data.get('recommend')
+    if recommend is not None:
+        if isinstance(recommend, bool):
+            raise ValueError('recommend must be a number')
+        recommend = int(recommend)
+        if not 0 <= recommend <= 10:
+            raise ValueError('recommend must be between 0 and 10')
+
+    text = {}
+    for field, limit in FEEDBACK_TEXT_LIMITS.items():
+        value = data.get(field)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f'{field} must be a string')
+        if value and len(value) > limit:
+            raise ValueError(f'{field} must be at most {limit} characters')
+        text[field] = value.strip() if value else None
+
+    # Derive sentiment from the rating when the client doesn't send one
+    sentiment = data.get('sentiment')
+    if sentiment is None:
+        sentiment = 'positive' if rating >= 4 else 'neutral' if rating >= 3 else 'negative'
+    if sentiment not in ('positive', 'neutral', 'negative'):
+        raise ValueError('sentiment must be positive, neutral or negative')
+
+    return {
+        'rating': rating,
+        'ratings': ratings,
+        'recommend': recommend,
+        'sentiment': sentiment,
+        'comment': text['comment'],
+        'attendee': text['attendee'],
+        'session': text['session'],
+        'timestamp': datetime.now().isoformat()
+    }
+
+def feedback_summary(aggregate, attendees=0):
+    """Build the /api/feedback payload from an aggregate"""
+    total = aggregate['total_responses']
+    overall = aggregate['overall']
+    nps = aggregate['nps']
+    nps_total = sum(nps.values())
+    sentiment = aggregate['sentiment']
+
+    return {
+        'total_responses': total,
+        'avg_rating': round(overall['mean'], 2),
+        'rating_stddev': round(running_variance(overall) ** 0.5, 2),
+        'rating_quantiles': {
+            'p25': sketch_quantile(aggregate['sketch'], 0.25),
+            'p50': sketch_quantile(aggregate['sketch'], 0.5),
+            'p75': sketch_quantile(aggregate['sketch'], 0.75),
+            'p90': sketch_quantile(aggregate['sketch'], 0.9)
+        },
+        'response_rate': min(100, round(total * 100 / attendees)) if attendees else 0,
+        'nps': round((nps['promoters'] - nps['detractors']) * 100 / nps_total) if nps_total else 0,
+        'nps_breakdown': nps,
+        'ratings': [
+            {
+                'category': category,
+                'rating': round(stats['mean'] * 100 / FEEDBACK_RATING_MAX),
+                'mean': round(stats['mean'], 2),
+                'variance': round(running_variance(stats), 3),
+                'count': stats['count']
+            }
+            for category, stats in aggregate['categories'].items()
+        ],
+        'sentiment': {key: round(count * 100 / total) if total else 0 for key, count in sentiment.items()},
+        'sentiment_counts': sentiment,
+        'comments': aggregate['comments']
+    }
+
+def all_events_feedback():
+    """Merge the feedback aggregates of every event"""
+    merged = new_feedback_aggregate()
+    for aggregate in event_feedback.values():
+        merged = merge_feedback_aggregates(merged, aggregate)
+    return merged
+
+feedback_totals = all_events_feedback()
+
+@app.route('/api/events/<int:event_id>/feedback', methods=['POST'])
+def submit_feedback(event_id):
+    """Submit a feedback response for an event"""
+    try:
+        event = next((e for e in events if e['id'] == event_id), None)
+        if not event:
+            return jsonify({'success': False, 'error': 'Event not found'}), 404
+        
+        response = parse_feedback_response(request.get_json() or {})
+        
+        with data_lock:
+            if str(event_id) not in event_feedback:
+                event_feedback[str(event_id)] = new_feedback_aggregate()
+            add_feedback_response(event_feedback[str(event_id)], response)
+            add_feedback_response(feedback_totals, response)
+            save_feedback_data()
+            total_responses = event_feedback[str(event_id)]['total_responses']
+        
+        return jsonify({'success': True, 'total_responses': total_responses})
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
 @app.route('/api/dashboard', methods=['GET'])
 def get_dashboard_stats():
     """Get dashboard overview statistics"""
     total_events = len(events)
     total_revenue = sum(event.get('ticketPrice', 0) * event.get('attendees', 0) for event in events)
     total_attendees = sum(event.get('attendees', 0) for event in events)
-    avg_rating = feedback_data.get('avg_rating', 4.6)
+    
+    # Use submitted feedback when there is any, otherwise the sample data
+    with data_lock:
+        overall = feedback_totals['overall']
+        avg_rating = round(overall['mean'], 2) if overall['count'] else feedback_data.get('avg_rating', 4.6)
     
     return jsonify({
         'stats': {
@@ -353,6 +857,40 @@ def get_events():
     """Get all events"""
     return jsonify({'events': events})
 
+@app.route('/api/events/search', methods=['GET'])
+def search_events_api():
+    """Search events by title, description and location.
+
+    Query params: q, status, currency, date_from/date_to (YYYY-MM-DD),
+    page and per_page. The last word of q matches as a prefix.
+    """
+    query = request.args.get('q', '')
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 20, type=int), 1), SEARCH_MAX_PER_PAGE)
+    
+    results = search_index(
+        query,
+        status=request.args.get('status'),
+        currency=request.args.get('currency'),
+        date_from=request.args.get('date_from'),
+        date_to=request.args.get('date_to')
+    )
+    
+    # Suggest completions for the word being typed
+    tokens = tokenize(query)
+    suggestions = complete_token(tokens[-1], limit=SEARCH_MAX_SUGGESTIONS) if tokens and not query[-1:].isspace() else []
+    
+    start = (page - 1) * per_page
+    return jsonify({
+        'success': True,
+        'query': query,
+        'total': len(results),
+        'page': page,
+        'per_page': per_page,
+        'results': [dict(event, score=round(score, 3)) for event, score in results[start:start + per_page]],
+        'suggestions': suggestions
+    })
+
 @app.route('/api/analytics/revenue', methods=['GET'])
 def get_revenue_analytics():
     """Get revenue and ticket sales analytics"""
@@ -365,8 +903,21 @@ def get_engagement_analytics():
 
 @app.route('/api/feedback', methods=['GET'])
 def get_feedback_analytics():
-    """Get post-event feedback analytics"""
-    return jsonify(feedback_data)
+    """Get post-event feedback analytics, optionally for one event (?event_id=)"""
+    event_id = request.args.get('event_id', type=int)
+    if event_id is not None:
+        event = next((e for e in events if e['id'] == event_id), None)
+        if not event:
+            return jsonify({'error': 'Event not found'}), 404
+        with data_lock:
+            aggregate = event_feedback.get(str(event_id), new_feedback_aggregate())
+            return jsonify(feedback_summary(aggregate, event.get('attendees', 0)))
+    
+    # Fall back to the sample data until any feedback has been submitted
+    if not event_feedback:
+        return jsonify(feedback_data)
+    with data_lock:
+        return jsonify(feedback_summary(feedback_totals, sum(e.get('attendees', 0) for e in events)))
 
 @app.route('/api/polls', methods=['GET', 'POST', 'DELETE'])
 def handle_polls():
@@ -446,11 +997,14 @@ def go_live_event(event_id):
             return jsonify({'success': False, 'error': 'Event not found'}), 404
         
         # Update event status to live
-        event['status'] = 'live'
-        event['live_start_time'] = datetime.now().isoformat()
-        
-        # Save events data
-        save_events(events)
+        with data_lock:
+            event['status'] = 'live'
+            event['live_start_time'] = datetime.now().isoformat()
+            
+            # Save events data
+            save_events(events)
+            index_event(event)
+            schedule_event_transitions(event)
         
         return jsonify({'success': True, 'message': 'Event is now live'})
         
@@ -483,11 +1037,14 @@ def end_event(event_id):
             return jsonify({'success': False, 'error': 'Event not found'}), 404
         
         # Update event status to completed
-        event['status'] = 'completed'
-        event['end_time'] = datetime.now().isoformat()
-        
-        # Save events data
-        save_events(events)
+        with data_lock:
+            event['status'] = 'completed'
+            event['end_time'] = datetime.now().isoformat()
+            
+            # Save events data
+            save_events(events)
+            index_event(event)
+            schedule_event_transitions(event)
         
         return jsonify({'success': True, 'message': 'Event ended successfully'})
         
@@ -499,8 +1056,7 @@ def load_engagement_data():
     global engagement_data
     try:
         if os.path.exists('data/engagement_data.json'):
-            with open('data/engagement_data.json', 'r') as f:
-                engagement_data = json.load(f)
+            engagement_data = read_json_file('data/engagement_data.json')
     except Exception as e:
         print(f"Error loading engagement data: {e}")
         engagement_data = {}
@@ -509,18 +1065,60 @@ def save_engagement_data():
     """Save engagement data to JSON file"""
     try:
         os.makedirs('data', exist_ok=True)
-        with open('data/engagement_data.json', 'w') as f:
-            json.dump(engagement_data, f, indent=2)
+        write_json_file('data/engagement_data.json', engagement_data)
     except Exception as e:
         print(f"Error saving engagement data: {e}")
 
+def record_engagement_change(event_key, kind, item_id=None):
+    """Bump the engagement version for an event and log what changed.
+
+    kind is 'poll' or 'question' for a single item, 'stats' for scalar
+    fields only, or 'reset' when the poll/question lists were replaced.
+    """
+    event_engagement = engagement_data[event_key]
+    version = event_engagement.get('version', 0) + 1
+    event_engagement['version'] = version
+
+    if event_key not in engagement_change_log:
+        engagement_change_log[event_key] = deque(maxlen=ENGAGEMENT_CHANGE_LOG_SIZE)
+    engagement_change_log[event_key].append((version, kind, item_id))
+    return version
+
+def get_engagement_changes(event_key, since):
+    """Return (poll_ids, question_ids) changed after version `since`.
+
+    Returns None when the change log can't answer, e.g. the client is too
+    far behind, the lists were replaced, or the server has restarted.
+    """
+    version = engagement_data.get(event_key, {}).get('version', 0)
+    if since == version:
+        return set(), set()
+    if since > version:
+        return None
+
+    log = engagement_change_log.get(event_key)
+    if not log or log[0][0] > since + 1:
+        return None
+
+    poll_ids = set()
+    question_ids = set()
+    for change_version, kind, item_id in reversed(log):
+        if change_version <= since:
+            break
+        if kind == 'reset':
+            return None
+        if kind == 'poll':
+            poll_ids.add(item_id)
+        elif kind == 'question':
+            question_ids.add(item_id)
+    return poll_ids, question_ids
+
 def load_tickets_data():
     """Load tickets data from JSON file"""
     global tickets_data
     try:
         if os.path.exists('data/tickets_data.json'):
-            with open('data/tickets_data.json', 'r') as f:
-                tickets_data = json.load(f)
+            tickets_data = read_json_file('data/tickets_data.json')
     except Exception as e:
         print(f"Error loading tickets data: {e}")
         tickets_data = {}
@@ -529,11 +1127,31 @@ def save_tickets_data():
     """Save tickets data to JSON file"""
     try:
         os.makedirs('data', exist_ok=True)
-        with open('data/tickets_data.json', 'w') as f:
-            json.dump(tickets_data, f, indent=2)
+        write_json_file('data/tickets_data.json', tickets_data)
     except Exception as e:
         print(f"Error saving tickets data: {e}")
 
+def load_feedback_data():
+    """Load feedback aggregates from JSON file"""
+    global event_feedback, feedback_totals
+    try:
+        if os.path.exists('data/feedback_data.json'):
+            event_feedback = read_json_file('data/feedback_data.json')
+    except Exception as e:
+        print(f"Error loading feedback data: {e}")
+        event_feedback = {}
+    
+    # Merge once at load; submissions keep the totals up to date after that
+    feedback_totals = all_events_feedback()
+
+def save_feedback_data():
+    """Save feedback aggregates to JSON file"""
+    try:
+        os.makedirs('data', exist_ok=True)
+        write_json_file('data/feedback_data.json', event_feedback)
+    except Exception as e:
+        print(f"Error saving feedback data: {e}")
+
 @app.route('/api/events/<int:event_id>/polls', methods=['GET', 'POST'])
 def manage_polls(event_id):
     """Get or create polls for an event"""
@@ -548,28 +1166,30 @@ def manage_polls(event_id):
             # Create new poll
             poll_data = request.get_json()
             
-            # Initialize engagement data for event if not exists
-            if str(event_id) not in engagement_data:
-                engagement_data[str(event_id)] = {
-                    'polls': [],
-                    'qa_questions': [],
-                    'live_attendance': 0,
-                    'engagement_rate': 0
-                }
+            with data_lock:
+                # Initialize engagement data for event if not exists
+                if str(event_id) not in engagement_data:
+                    engagement_data[str(event_id)] = {
+                        'polls': [],
+                        'qa_questions': [],
+                        'live_attendance': 0,
+                        'engagement_rate': 0
+                    }
             
-            # Create new poll
-            new_poll = {
-                'id': len(engagement_data[str(event_id)]['polls']) + 1,
-                'question': poll_data.get('question'),
-                'options': poll_data.get('options', []),
-                'responses': poll_data.get('responses', 0),
-                'option_votes': {option: 0 for option in poll_data.get('options', [])},  # Track votes per option
-                'active': poll_data.get('active', True),
-                'created': datetime.now().isoformat()
-            }
+                # Create new poll
+                new_poll = {
+                    'id': len(engagement_data[str(event_id)]['polls']) + 1,
+                    'question': poll_data.get('question'),
+                    'options': poll_data.get('options', []),
+                    'responses': poll_data.get('responses', 0),
+                    'option_votes': {option: 0 for option in poll_data.get('options', [])},  # Track votes per option
+                    'active': poll_data.get('active', True),
+                    'created': datetime.now().isoformat()
+                }
             
-            engagement_data[str(event_id)]['polls'].append(new_poll)
-            save_engagement_data()
+                engagement_data[str(event_id)]['polls'].append(new_poll)
+                record_engagement_change(str(event_id), 'poll', new_poll['id'])
+                save_engagement_data()
             
             return jsonify({'success': True, 'poll': new_poll})
             
@@ -593,9 +1213,11 @@ def vote_poll(event_id, poll_id):
         
         # Add vote
         if selected_option in poll['option_votes']:
-            poll['option_votes'][selected_option] += 1
-            poll['responses'] += 1
-            save_engagement_data()
+            with data_lock:
+                poll['option_votes'][selected_option] += 1
+                poll['responses'] += 1
+                record_engagement_change(str(event_id), 'poll', poll_id)
+                save_engagement_data()
             
             return jsonify({'success': True, 'poll': poll})
         else:
@@ -618,26 +1240,28 @@ def manage_qa_questions(event_id):
             # Create new Q&A question
             question_data = request.get_json()
             
-            # Initialize engagement data for event if not exists
-            if str(event_id) not in engagement_data:
-                engagement_data[str(event_id)] = {
-                    'polls': [],
-                    'qa_questions': [],
-                    'live_attendance': 0,
-                    'engagement_rate': 0
-                }
+            with data_lock:
+                # Initialize engagement data for event if not exists
+                if str(event_id) not in engagement_data:
+                    engagement_data[str(event_id)] = {
+                        'polls': [],
+                        'qa_questions': [],
+                        'live_attendance': 0,
+                        'engagement_rate': 0
+                    }
             
-            # Create new question
-            new_question = {
-                'id': len(engagement_data[str(event_id)]['qa_questions']) + 1,
-                'question': question_data.get('question'),
-                'answered': question_data.get('answered', False),
-                'votes': question_data.get('votes', 0),
-                'timestamp': datetime.now().isoformat()
-            }
+                # Create new question
+                new_question = {
+                    'id': len(engagement_data[str(event_id)]['qa_questions']) + 1,
+                    'question': question_data.get('question'),
+                    'answered': question_data.get('answered', False),
+                    'votes': question_data.get('votes', 0),
+                    'timestamp': datetime.now().isoformat()
+                }
             
-            engagement_data[str(event_id)]['qa_questions'].append(new_question)
-            save_engagement_data()
+                engagement_data[str(event_id)]['qa_questions'].append(new_question)
+                record_engagement_change(str(event_id), 'question', new_question['id'])
+                save_engagement_data()
             
             return jsonify({'success': True, 'question': new_question})
             
@@ -646,7 +1270,12 @@ def manage_qa_questions(event_id):
 
 @app.route('/api/events/<int:event_id>/engagement', methods=['GET', 'POST'])
 def get_engagement_data(event_id):
-    """Get or update engagement data for an event"""
+    """Get or update engagement data for an event.
+
+    GET accepts ?since=<version> to return only the polls and questions
+    changed after that version. The response has full=True when the
+    client has to replace its state instead of merging it.
+    """
     try:
         if request.method == 'GET':
             # Get engagement data for this event
@@ -666,14 +1295,28 @@ def get_engagement_data(event_id):
             total_responses = sum(p.get('responses', 0) for p in event_engagement['polls'])
             engagement_rate = min(75 + (total_responses + total_questions) // 10, 95) if (total_polls > 0 or total_questions > 0) else 0
             
+            # Send only what changed since the client's version when possible
+            polls = event_engagement['polls']
+            questions = event_engagement['qa_questions']
+            changes = None
+            since = request.args.get('since', type=int)
+            if since is not None:
+                changes = get_engagement_changes(str(event_id), since)
+            if changes is not None:
+                poll_ids, question_ids = changes
+                polls = [p for p in polls if p['id'] in poll_ids]
+                questions = [q for q in questions if q['id'] in question_ids]
+            
             return jsonify({
                 'success': True,
+                'version': event_engagement.get('version', 0),
+                'full': changes is None,
                 'live_attendance': event_engagement['live_attendance'],
                 'active_polls': active_polls,
                 'qa_questions': total_questions,
                 'engagement_rate': engagement_rate,
-                'polls': event_engagement['polls'],
-                'questions': event_engagement['qa_questions'],
+                'polls': polls,
+                'questions': questions,
                 'breakdown': [
                     {'name': 'Poll Participation', 'value': 40},
                     {'name': 'Q&A Sessions', 'value': 32},
@@ -685,17 +1328,25 @@ def get_engagement_data(event_id):
             # Update engagement data
             update_data = request.get_json()
             
-            if str(event_id) not in engagement_data:
-                engagement_data[str(event_id)] = {
-                    'polls': [],
-                    'qa_questions': [],
-                    'live_attendance': 240,
-                    'engagement_rate': 0
-                }
+            with data_lock:
+                if str(event_id) not in engagement_data:
+                    engagement_data[str(event_id)] = {
+                        'polls': [],
+                        'qa_questions': [],
+                        'live_attendance': 240,
+                        'engagement_rate': 0
+                    }
             
-            # Update the data
-            engagement_data[str(event_id)].update(update_data)
-            save_engagement_data()
+                # Update the data (the version is managed by the server)
+                update_data.pop('version', None)
+                engagement_data[str(event_id)].update(update_data)
+            
+                # Replacing polls or questions invalidates any delta
+                if 'polls' in update_data or 'qa_questions' in update_data:
+                    record_engagement_change(str(event_id), 'reset')
+                else:
+                    record_engagement_change(str(event_id), 'stats')
+                save_engagement_data()
             
             return jsonify({'success': True})
             
@@ -730,9 +1381,11 @@ def manage_tickets(event_id):
             tickets_data[str(event_id)].update(ticket_data)
             
             # Update live attendance based on ticket sales
-            if str(event_id) in engagement_data:
-                engagement_data[str(event_id)]['live_attendance'] = ticket_data.get('total_sold', 0)
-                save_engagement_data()
+            with data_lock:
+                if str(event_id) in engagement_data:
+                    engagement_data[str(event_id)]['live_attendance'] = ticket_data.get('total_sold', 0)
+                    record_engagement_change(str(event_id), 'stats')
+                    save_engagement_data()
             
             save_tickets_data()
             return jsonify({'success': True})
@@ -740,16 +1393,172 @@ def manage_tickets(event_id):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
+# Automatic event lifecycle: a heap of upcoming transitions ordered by due
+# time. Each transition queues the next one, so the worker only ever looks
+# at the head of the heap instead of scanning all events.
+lifecycle_queue = []  # (when, seq, event_id, action)
+lifecycle_seq = itertools.count()
+lifecycle_condition = threading.Condition()
+
+def parse_event_time(value):
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+def event_start_time(event):
+    """Scheduled start of an event from its date and time fields"""
+    try:
+        return datetime.strptime(f"{event['date']} {event['time']}", '%Y-%m-%d %H:%M')
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def schedule_lifecycle(event_id, action, when):
+    """Queue a lifecycle action and wake the worker"""
+    with lifecycle_condition:
+        heapq.heappush(lifecycle_queue, (when, next(lifecycle_seq), event_id, action))
+        lifecycle_condition.notify()
+
+def schedule_event_transitions(event):
+    """Queue the next lifecycle step for an event based on its status"""
+    status = event.get('status', 'upcoming')
+    if status == 'upcoming':
+        start = event_start_time(event)
+        if start:
+            schedule_lifecycle(event['id'], 'prewarm', start - EVENT_PREWARM_LEAD)
+            schedule_lifecycle(event['id'], 'go_live', start)
+    elif status == 'live':
+        # Record a start time if missing; 'complete' checks against it
+        if not parse_event_time(event.get('live_start_time')):
+            event['live_start_time'] = (event_start_time(event) or datetime.now()).isoformat()
+        started = parse_event_time(event['live_start_time'])
+        schedule_lifecycle(event['id'], 'complete', started + EVENT_DEFAULT_DURATION)
+    elif status == 'completed' and not event.get('archived_at'):
+        if not parse_event_time(event.get('end_time')):
+            event['end_time'] = datetime.now().isoformat()
+        ended = parse_event_time(event['end_time'])
+        schedule_lifecycle(event['id'], 'archive', ended + EVENT_ARCHIVE_DELAY)
+
+def prewarm_event(event):
+    """Set up in-memory engagement state before an event goes live"""
+    event_key = str(event['id'])
+    if event_key not in engagement_data:
+        engagement_data[event_key] = {
+            'polls': [],
+            'qa_questions': [],
+            'live_attendance': 0,
+            'engagement_rate': 0
+        }
+    if event_key not in engagement_change_log:
+        engagement_change_log[event_key] = deque(maxlen=ENGAGEMENT_CHANGE_LOG_SIZE)
+
+def archive_event(event):
+    """Drop in-memory engagement structures (the caller saves the data)"""
+    engagement_change_log.pop(str(event['id']), None)
+    event['archived_at'] = datetime.now().isoformat()
+
+def apply_lifecycle_action(event, action, when):
+    """Run a lifecycle action, returning True if the event changed.
+
+    Actions that no longer match the event's status or times (e.g. someone
+    ended the event by hand, or relaunched it) are skipped. Callers must
+    hold data_lock.
+    """
+    status = event.get('status', 'upcoming')
+    if action == 'prewarm' and status == 'upcoming':
+        prewarm_event(event)
+        return False
+    if action == 'go_live' and status == 'upcoming' and event_start_time(event) == when:
+        prewarm_event(event)
+        event['status'] = 'live'
+        event['live_start_time'] = when.isoformat()
+    elif (action == 'complete' and status == 'live'
+            and parse_event_time(event.get('live_start_time')) == when - EVENT_DEFAULT_DURATION):
+        event['status'] = 'completed'
+        event['end_time'] = when.isoformat()
+    elif (action == 'archive' and status == 'completed'
+            and parse_event_time(event.get('end_time')) == when - EVENT_ARCHIVE_DELAY):
+        archive_event(event)
+    else:
+        return False
+
+    index_event(event)
+    schedule_event_transitions(event)
+    return True
+
+def run_due_lifecycle(now=None):
+    """Apply every lifecycle action due by `now`, returning how many ran"""
+    now = now or datetime.now()
+    changed = 0
+    archived = False
+    with data_lock:
+        while True:
+            with lifecycle_condition:
+                if not lifecycle_queue or lifecycle_queue[0][0] > now:
+                    break
+                when, _, event_id, action = heapq.heappop(lifecycle_queue)
+            
+            event = events_by_id.get(event_id)
+            if event and apply_lifecycle_action(event, action, when):
+                changed += 1
+                archived = archived or action == 'archive'
+        
+        # Save once per batch rather than once per event
+        if changed:
+            save_events(events)
+        if archived:
+            save_engagement_data()
+    return changed
+
+def lifecycle_worker():
+    """Sleep until the next transition is due, then apply it"""
+    while True:
+        with lifecycle_condition:
+            timeout = 60
+            if lifecycle_queue:
+                timeout = min(timeout, (lifecycle_queue[0][0] - datetime.now()).total_seconds())
+            if timeout > 0:
+                lifecycle_condition.wait(timeout)
+        try:
+            run_due_lifecycle()
+        except Exception as e:
+            print(f"Error running event lifecycle: {e}")
+
+lifecycle_started = False
+
+@app.before_request
+def start_lifecycle_scheduler():
+    """Queue transitions for all events and start the background worker.
+
+    Runs on the first request so it starts in whichever process actually
+    serves requests (reloader child, flask run or a WSGI server).
+    """
+    global lifecycle_started
+    if lifecycle_started:
+        return
+    with data_lock:
+        if lifecycle_started:
+            return
+        lifecycle_started = True
+        for event in events:
+            schedule_event_transitions(event)
+        # Catch up on overdue transitions before serving this request
+        run_due_lifecycle()
+    threading.Thread(target=lifecycle_worker, daemon=True).start()
+
+# Load persisted state at import so every way of serving the app (python
+# app.py, flask run, a WSGI server) has it before the scheduler's catch-up
+load_engagement_data()
+load_tickets_data()
+load_feedback_data()
+
 # Initialize and load all data on startup
 if __name__ == '__main__':
-    load_events()
-    load_engagement_data()
-    load_tickets_data()
-    
     print("🚀 COUSREVITA 2 Event Management System")
     print(f"📊 Loaded {len(events)} events")
     print(f"🎯 Loaded engagement data for {len(engagement_data)} events")
     print(f"🎫 Loaded ticket data for {len(tickets_data)} events")
+    print(f"⭐ Loaded feedback data for {len(event_feedback)} events")
     print("🌐 Server running on http://localhost:5000")
     
     app.run(debug=True, port=5000, host='0.0.0.0')
\ No newline at end of file